@@ -7,7 +7,8 @@ import copy
 
 from pandapower.auxiliary import get_free_id
 from pandapower.control.util.auxiliary import \
-    drop_same_type_existing_controllers, log_same_type_existing_controllers
+    drop_same_type_existing_controllers, log_same_type_existing_controllers, \
+    _append_to_controller_type_cache, _invalidate_controller_type_cache
 from pandapower.io_utils import JSONSerializableClass
 
 try:
@@ -199,6 +200,12 @@ class Controller(BasicCtrl):
                      "order": order, "level": level}
         added_index = super().add_to_net(net=net, element='controller', index=index, overwrite=overwrite,
                            fill_dict=fill_dict, preserve_dtypes=True)
+        if overwrite:
+            # an overwrite replaces the controller object without changing the net.controller
+            # index, which the lazy cache cannot detect on its own
+            _invalidate_controller_type_cache(net)
+        else:
+            _append_to_controller_type_cache(net, added_index, self)
         return added_index
 
     def time_step(self, net, time):
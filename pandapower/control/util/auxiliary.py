@@ -5,6 +5,7 @@
 import sys
 
 import numpy as np
+import pandas as pd
 from pandas import Index, Series
 
 from pandapower.auxiliary import soft_dependency_error
@@ -12,11 +13,10 @@ from pandapower.toolbox import ensure_iterability
 from .characteristic import SplineCharacteristic
 
 try:
-    import matplotlib.pyplot as plt
-
-    MATPLOTLIB_INSTALLED = True
+    from numba import jit
+    numba_installed = True
 except ImportError:
-    MATPLOTLIB_INSTALLED = False
+    numba_installed = False
 
 try:
     import pandaplan.core.pplog as pplog
@@ -35,69 +35,211 @@ def asarray(val, dtype=np.float64):
     :param dtype: np.dtype for the output array
     :return: numpy array of the dtype set
     """
-    # val is a list, tuple etc
-    if not np.isscalar(val) and np.ndim(val) > 0:
-        np_val = np.asarray(val, dtype=dtype)
-    else:
-        # val is a scalar number
-        np_val = np.asarray([val], dtype=dtype)
+    # promotes scalars and 0-d arrays to 1-d in the same C-level call as the dtype cast
+    return np.atleast_1d(np.asarray(val, dtype=dtype))
 
-    return np_val
 
+def _invalidate_controller_type_cache(net):
+    """
+    Drops the cached type->indices map of net.controller. Needs to be called whenever a
+    controller object is replaced in place, i.e. without a change of the net.controller index.
+    """
+    net.controller.attrs.pop("_type_index_cache", None)
 
-def get_controller_index_by_type(net, ctrl_type, idx=[]):
+
+def _controller_type_indices(net):
+    """
+    Returns a {type: indices list} map over net.controller.object. The map is cached in
+    net.controller.attrs and rebuilt lazily whenever the net.controller index changed, so that
+    repeated type lookups (e.g. one per controller creation) do not re-scan the whole table.
+    Freshly created controllers are appended by _append_to_controller_type_cache instead of
+    invalidating, which keeps the cache hot across bulk-create loops.
+    """
+    index = net.controller.index.to_numpy()
+    cache = net.controller.attrs.get("_type_index_cache")
+    if cache is None or not np.array_equal(cache[0], index):
+        type_indices = {}
+        for i, obj in zip(index, net.controller.object.to_numpy(copy=False)):
+            type_indices.setdefault(type(obj), []).append(i)
+        cache = (index, type_indices)
+        net.controller.attrs["_type_index_cache"] = cache
+    return cache[1]
+
+
+def _append_to_controller_type_cache(net, index, controller):
+    """
+    Registers a controller that was just appended to net.controller in the cached
+    type->indices map, so that the creation of N controllers costs N cheap appends instead of
+    N full table re-scans. Anything but a clean append of this one row (e.g. a filled-in
+    existing row, or a cache that was already stale) drops the cache instead.
+    """
+    cache = net.controller.attrs.get("_type_index_cache")
+    if cache is None:
+        return
+    cached_index, type_indices = cache
+    current_index = net.controller.index.to_numpy()
+    if len(current_index) != len(cached_index) + 1 or current_index[-1] != index or \
+            not np.array_equal(cached_index, current_index[:-1]):
+        _invalidate_controller_type_cache(net)
+        return
+    type_indices.setdefault(type(controller), []).append(index)
+    net.controller.attrs["_type_index_cache"] = (current_index, type_indices)
+
+
+def get_controller_index_by_type(net, ctrl_type, idx=None):
     """
     Returns controller indices of a given type as list.
     """
-    idx = idx if len(idx) else net.controller.index
-    return [i for i in idx if isinstance(net.controller.object.at[i], ctrl_type)]
+    default_idx = idx is None or not len(idx)
+    idx = net.controller.index if default_idx else idx
+    type_indices = _controller_type_indices(net)
+    hits = [ind for typ, ind in type_indices.items() if issubclass(typ, ctrl_type)]
+    if not len(hits):
+        return []
+    if default_idx and len(hits) == 1:
+        # single matching type queried over the whole table - the cached indices are already
+        # in table order, no membership mask needed
+        return list(hits[0])
+    idx = np.asarray(idx)
+    mask = np.isin(idx, np.concatenate(hits))
+    return list(idx[mask])
+
+
+def get_controller_index_by_typename(net, typename, idx=None, case_sensitive=False):
+    """
+    Returns controller indices of a given name of type as list.
+    """
+    idx = net.controller.index if idx is None or not len(idx) else idx
+    objects = net.controller.object.loc[idx].to_numpy(copy=False)
+    typename = typename if case_sensitive else typename.lower()
+
+    def name_matches(obj):
+        # the str() of a controller conventionally starts with the class name - compare that
+        # first and only build the full repr if the class name does not match
+        name = type(obj).__name__ if case_sensitive else type(obj).__name__.lower()
+        if name == typename:
+            return True
+        name = str(obj).split(" ", 1)[0]
+        return (name if case_sensitive else name.lower()) == typename
+
+    mask = np.fromiter((name_matches(obj) for obj in objects), dtype=np.bool_, count=len(objects))
+    return list(np.asarray(idx)[mask])
+
+
+if numba_installed:
+    @jit(nopython=True, cache=True)
+    def _numeric_arrays_equal(attribute_values, query_values):
+        """
+        Element-wise equality of two equally shaped numeric arrays as a numba-compiled typed
+        loop, so that the hot comparison of _controller_attributes_query needs neither
+        pandas/numpy comparison dispatch nor exception handling.
+        """
+        attribute_values = attribute_values.ravel()
+        query_values = query_values.ravel()
+        for pos in range(attribute_values.size):
+            if attribute_values[pos] != query_values[pos]:
+                return False
+        return True
+else:
+    def _numeric_arrays_equal(attribute_values, query_values):
+        """
+        Element-wise equality of two equally shaped numeric arrays. Without numba the typed
+        loop would run per element in pure python, so numpy's C-level comparison is the
+        faster implementation here.
+        """
+        return bool(np.array_equal(attribute_values, query_values))
+
+
+def _attributes_intersect(attribute_values, query_values):
+    """
+    Returns a boolean whether two differently sized collections of attribute values intersect.
+    """
+    attribute_values = np.asarray(attribute_values)
+    query_values = np.asarray(query_values)
+    if attribute_values.dtype.kind == "O" or query_values.dtype.kind == "O":
+        # numpy cannot hash arbitrary objects - fall back to python sets
+        return bool(set(attribute_values) & set(query_values))
+    return bool(np.isin(attribute_values, query_values).any())
 
 
-def get_controller_index_by_typename(net, typename, idx=[], case_sensitive=False):
+def _value_kind(value):
     """
-    Returns controller indices of a given name of type as list.
+    Classifies a value for the matcher dispatch: "array" for numpy/pandas values with
+    element-wise comparison semantics (numpy scalars included - comparing one against a python
+    sequence broadcasts), "sequence" for python containers with value-equality semantics,
+    "scalar" for everything else.
     """
-    idx = idx if len(idx) else net.controller.index
-    if case_sensitive:
-        return [i for i in idx if str(net.controller.object.at[i]).split(" ")[0] == typename]
-    else:
-        return [i for i in idx if str(net.controller.object.at[i]).split(" ")[0].lower() ==
-                typename.lower()]
+    if isinstance(value, (np.ndarray, np.generic, Series, Index)):
+        return "array"
+    if hasattr(value, "__len__") and not isinstance(value, str):
+        return "sequence"
+    return "scalar"
+
+
+def _match_values(attribute_value, query_value):
+    return bool(attribute_value == query_value)
+
+
+def _match_arrays(attribute_value, query_value):
+    # element-wise comparison - decided by an explicit shape test instead of catching the
+    # ValueError a truth test of the comparison array would raise
+    attribute_array = np.asarray(attribute_value)
+    query_array = np.asarray(query_value)
+    if attribute_array.ndim == 0 or query_array.ndim == 0 or \
+            attribute_array.shape == query_array.shape:
+        comparison = attribute_array == query_array
+        if not isinstance(comparison, (np.ndarray, np.bool_)):
+            # numpy cannot compare the dtypes element-wise (e.g. numbers vs. strings) and
+            # returned a plain python bool instead of a comparison array
+            return bool(comparison)
+        return bool(comparison.all()) if comparison.size else False
+    return _attributes_intersect(attribute_array, query_array)
+
+
+_MATCHERS = {(attribute_kind, query_kind):
+             _match_arrays if "array" in (attribute_kind, query_kind) else _match_values
+             for attribute_kind in ("scalar", "sequence", "array")
+             for query_kind in ("scalar", "sequence", "array")}
 
 
 def _controller_attributes_query(controller, parameters):
     """
     Returns a boolean if the controller attributes matches given parameter dict data
     """
-    complete_match = True
+    attributes = vars(controller)
     element_index_match = True
-    for key in parameters.keys():
-        if key not in controller.__dict__:
+    for key, query_value in parameters.items():
+        if key not in attributes:
             logger.debug(str(key) + " is no attribute of controller object " + str(controller))
             return False
-        try:
-            match = bool(controller.__getattribute__(key) == parameters[key])
-        except ValueError:
-            try:
-                match = all(controller.__getattribute__(key) == parameters[key])
-            except ValueError:
-                match = bool(len(set(controller.__getattribute__(key)) & set(parameters[key])))
+        attribute_value = attributes[key]
+        match = None
+        if isinstance(attribute_value, np.ndarray) and attribute_value.dtype.kind in "iuf" \
+                and attribute_value.size:
+            query_array = np.asarray(query_value)
+            if query_array.dtype.kind in "iuf" and query_array.shape == attribute_value.shape:
+                # hot numeric path: typed comparison without pandas dispatch or exceptions
+                match = _numeric_arrays_equal(attribute_value, query_array)
+        if match is None:
+            match = _MATCHERS[_value_kind(attribute_value), _value_kind(query_value)](
+                attribute_value, query_value)
         if key == "element_index":
             element_index_match = match
-        else:
-            complete_match &= match
+        elif not match:
+            # mismatch of a regular attribute - no need to look at the remaining ones
+            return False
 
-    if complete_match and not element_index_match:
-        intersect_elms = set(ensure_iterability(controller.__getattribute__("element_index"))) & \
+    if not element_index_match:
+        intersect_elms = set(ensure_iterability(attributes["element_index"])) & \
                          set(ensure_iterability(parameters["element_index"]))
         if len(intersect_elms):
             logger.info("'element_index' has an intersection of " + str(intersect_elms) +
                         " with Controller %i" % controller.index)
 
-    return complete_match & element_index_match
+    return element_index_match
 
 
-def get_controller_index(net, ctrl_type=None, parameters=None, idx=[]):
+def get_controller_index(net, ctrl_type=None, parameters=None, idx=None):
     """ Returns indices of searched controllers. Parameters can specify the search query.
 
     INPUT:
@@ -109,7 +251,7 @@ def get_controller_index(net, ctrl_type=None, parameters=None, idx=[]):
         **parameters** (None, dict) - Dict of parameter names, which are in the controller object or
             net.controller DataFrame
 
-        **idx** ([], list) - list of indices in net.controller to be searched for. If list is empty
+        **idx** (None, list) - list of indices in net.controller to be searched for. If None,
             all indices are considered.
 
     OUTPUT:
@@ -117,7 +259,7 @@ def get_controller_index(net, ctrl_type=None, parameters=None, idx=[]):
             matches given ctrl_type or parameters
     """
     #    logger.debug(ctrl_type, parameters, idx)
-    idx = idx if len(idx) else net.controller.index
+    idx = net.controller.index if idx is None or not len(idx) else idx
     if ctrl_type is not None:
         if isinstance(ctrl_type, str):
             idx = get_controller_index_by_typename(net, ctrl_type, idx)
@@ -127,13 +269,20 @@ def get_controller_index(net, ctrl_type=None, parameters=None, idx=[]):
         df_keys = [k for k in parameters.keys() if k in net.controller.columns]
         attributes_keys = list(set(parameters.keys()) - set(df_keys))
         attributes_dict = {k: parameters[k] for k in attributes_keys}
-        # query of parameters in net.controller dataframe
-        idx = Index(idx, dtype=np.int64)
+        # query of parameters in net.controller dataframe with one combined mask: one isin hash
+        # over idx instead of an Index promotion plus one intersection per key
+        mask = np.isin(net.controller.index.to_numpy(), np.asarray(idx))
         for df_key in df_keys:
-            idx = idx.intersection(net.controller.index[net.controller[df_key] == parameters[df_key]])
-        # query of parameters in controller object attributes
-        idx = [i for i in idx if _controller_attributes_query(
-            net.controller.object.loc[i], attributes_dict)]
+            mask &= net.controller[df_key].to_numpy() == parameters[df_key]
+        idx = net.controller.index[mask]
+        # query of parameters in controller object attributes - materialize the object column
+        # once instead of one .loc hash lookup per controller
+        if len(attributes_dict):
+            objects = net.controller.object.to_numpy(copy=False)[mask]
+            idx = [i for i, obj in zip(idx, objects)
+                   if _controller_attributes_query(obj, attributes_dict)]
+        else:
+            idx = list(idx)
     return idx
 
 
@@ -200,7 +349,11 @@ def drop_same_type_existing_controllers(net, this_ctrl_type, index=None, matchin
 
 
 def plot_characteristic(characteristic, start, stop, num=20, xlabel=None, ylabel=None):
-    if not MATPLOTLIB_INSTALLED:
+    # matplotlib is imported lazily so that importing this module does not pay for the
+    # matplotlib backend bootstrap unless something is actually plotted
+    try:
+        import matplotlib.pyplot as plt
+    except ImportError:
         soft_dependency_error(str(sys._getframe().f_code.co_name) + "()", "matplotlib")
     x = np.linspace(start, stop, num)
     y = characteristic(x)
@@ -241,11 +394,10 @@ def create_trafo_characteristics(net, trafotable, trafo_index, variable, x_point
     net[trafotable].loc[trafo_index, 'tap_dependent_impedance'] = True
 
     if single_mode:
-        zip_params = zip([trafo_index], [x_points], [y_points])
-    else:
-        zip_params = zip(trafo_index, x_points, y_points)
+        trafo_index, x_points, y_points = [trafo_index], [x_points], [y_points]
 
-    for tid, x_p, y_p in zip_params:
-        # create the characteristic and set its index in the trafotable
-        s = SplineCharacteristic(net, x_p, y_p)
-        net[trafotable].at[tid, col] = s.index
+    # create all characteristics in one batch and write their indices into the trafo table with
+    # one column-slice assignment instead of one .at dispatch per transformer; the nullable
+    # Int64 wrapper keeps the column from degrading to plain int64 when all rows are assigned
+    char_indices = SplineCharacteristic.add_batch_to_net(net, x_points, y_points)
+    net[trafotable].loc[trafo_index, col] = pd.array(char_indices, dtype="Int64")
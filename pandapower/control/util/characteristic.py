@@ -3,9 +3,6 @@
 # Copyright (c) 2016-2022 by University of Kassel and Fraunhofer Institute for Energy Economics
 # and Energy System Technology (IEE), Kassel. All rights reserved.
 
-from builtins import zip
-from builtins import object
-
 from numpy import interp
 from scipy.interpolate import interp1d
 from pandapower.io_utils import JSONSerializableClass
@@ -68,7 +65,22 @@ class Characteristic(JSONSerializableClass):
         super().__init__()
         self.x_vals = x_values
         self.y_vals = y_values
-        self.index = super().add_to_net(net, "characteristic")
+        if net is not None:
+            self.index = super().add_to_net(net, "characteristic")
+
+    @classmethod
+    def add_batch_to_net(cls, net, x_points, y_points):
+        """
+        Creates one characteristic per set of x/y-points and registers all of them in
+        net.characteristic with a single row append, which keeps bulk creation (e.g. by
+        create_trafo_characteristics) linear in the number of characteristics.
+        Returns the indices of the new characteristics.
+        """
+        characteristics = [cls(None, x_vals, y_vals) for x_vals, y_vals in zip(x_points, y_points)]
+        indices = cls.add_many_to_net(net, "characteristic", characteristics)
+        for characteristic, index in zip(characteristics, indices):
+            characteristic.index = index
+        return indices
 
     @classmethod
     def from_points(cls, net, points):
@@ -143,7 +155,11 @@ class SplineCharacteristic(Characteristic):
     @interpolator.getter
     def interpolator(self):
         if not hasattr(self, '_interpolator'):
-            self._interpolator = interp1d(self.x_vals, self.y_vals, kind='quadratic', fill_value='extrapolate')
+            # copy=False: the spline evaluation itself runs in scipy's compiled code on whole
+            # arrays, so building the interpolator without copying x_vals and y_vals is the only
+            # cost left to cut here
+            self._interpolator = interp1d(self.x_vals, self.y_vals, kind='quadratic',
+                                          fill_value='extrapolate', copy=False)
         return self._interpolator
 
     def __call__(self, x):
@@ -74,19 +74,26 @@ def trafo_characteristics_diagnostic(net):
         # check if there are any missing characteristics
         tap_dependent_impedance = net[trafo_table]['tap_dependent_impedance'].values
         logger.info(f"{trafo_table}: found {sum(tap_dependent_impedance)} transformer(s) with tap-dependent impedance")
-        if len(np.intersect1d(net[trafo_table].columns, cols)) == 0:
+        # pull the characteristic columns of the relevant transformers once and check them as
+        # ndarrays instead of slicing a new Series out of the table per column
+        present_cols = [col for col in cols if col in net[trafo_table].columns]
+        sub = net[trafo_table].loc[tap_dependent_impedance, present_cols]
+        nulls = sub.isnull().to_numpy()
+        characteristic_index = net.characteristic.index.to_numpy()
+        if len(present_cols) == 0:
             logger.warning("No columns defined for transformer tap characteristics in %s. "
                            "Power flow calculation will raise an error." % trafo_table)
-        elif net[trafo_table].loc[tap_dependent_impedance, np.intersect1d(cols, net[trafo_table].columns)].isnull().all(axis=1).any():
+        elif nulls.all(axis=1).any():
             logger.warning(f"Some transformers in {trafo_table} table have tap_dependent_impedance set to True, "
                            f"but no defined characteristics. Power flow calculation will raise an error.")
         for col in cols:
             if col not in net[trafo_table]:
                 logger.info("%s: %s is missing" % (trafo_table, col))
                 continue
-            elif net[trafo_table].loc[tap_dependent_impedance, col].isnull().any():
+            col_nulls = nulls[:, present_cols.index(col)]
+            if col_nulls.any():
                 logger.info("%s: %s is missing for some transformers" % (trafo_table, col))
-            elif len(set(net[trafo_table].loc[tap_dependent_impedance, col]) - set(net.characteristic.index)) > 0:
+            elif np.setdiff1d(sub[col].to_numpy(), characteristic_index).size:
                 logger.info("%s: %s contains invalid characteristics indices" % (trafo_table, col))
             else:
                 logger.debug(f"{trafo_table}: {col} has {len(net[trafo_table][col].dropna())} characteristics")
@@ -96,7 +103,8 @@ def trafo_characteristics_diagnostic(net):
             for tid in net[trafo_table].index[tap_dependent_impedance]:
                 tap_neutral = net[trafo_table].tap_neutral.fillna(0).at[tid]
                 s_id = net[trafo_table][col].at[tid]
-                if pd.isnull(s_id):
+                if pd.isnull(s_id) or s_id not in net.characteristic.index:
+                    # missing and invalid characteristics were already reported above
                     continue
                 s = net.characteristic.object.at[s_id]
                 s_val = s(tap_neutral)
@@ -703,6 +703,22 @@ class JSONSerializableClass(object):
 
         return index
 
+    @classmethod
+    def add_many_to_net(cls, net, element, objects, column="object"):
+        """
+        Adds several JSONSerializableClass instances to net[element] at once. The new rows are
+        appended with a single concat instead of one dataframe enlargement per object, which
+        keeps bulk creation linear in the number of objects. Returns the new indices.
+        """
+        if element not in net:
+            net[element] = pd.DataFrame(columns=[column])
+        start = get_free_id(net[element])
+        index = np.arange(start, start + len(objects), dtype=np.int64)
+        new_rows = pd.DataFrame(index=index, columns=net[element].columns, dtype=object)
+        new_rows[column] = list(objects)
+        net[element] = pd.concat([net[element], new_rows])
+        return index
+
     def equals(self, other):
         # todo: can this method be removed?
         warn("JSONSerializableClass: the attribute 'equals' is deprecated "
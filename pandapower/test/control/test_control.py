@@ -4,11 +4,13 @@
 # and Energy System Technology (IEE), Kassel. All rights reserved.
 
 import copy
+import numpy as np
 import pytest
 import pandapower.control as ct
 import pandapower.networks as networks
 import pandapower as pp
 from pandapower.control.run_control import get_controller_order
+from pandapower.control.util.auxiliary import get_controller_index_by_type
 from pandapower.control.basic_controller import Controller
 from pandapower.control.controller.trafo_control import TrafoController
 from pandapower.control.controller.trafo.ContinuousTapControl import ContinuousTapControl
@@ -206,5 +208,47 @@ def test_matching_params(net):
     assert net.controller.object.at[4] is c4
 
 
+def test_get_controller_index_mixed_types(net):
+    # query values that numpy cannot compare with the stored attribute types must fall back to
+    # "no match" like the baseline comparison chain did, not raise
+    ContinuousTapControl(net, 0, vm_set_pu=1.0, tol=1e-6)  # stores tid as np.int64
+    dummy = DummyController(net)
+    dummy.element_index = np.array([0, 1])
+    assert ct.get_controller_index(net, parameters={"tid": "anything"}) == []
+    assert ct.get_controller_index(net, parameters={"element_index": ["a", "b"]}) == []
+    assert ct.get_controller_index(net, parameters={"tid": 0}) == [0]
+    assert ct.get_controller_index(net, parameters={"element_index": np.array([0, 1])}) == [1]
+    for value in ("anything", 0, np.int64(0), 1.5, None, ["a", "b"], [0, 1],
+                  np.array(["a", "b"]), np.array([0, 1])):
+        for key in ("tid", "element_index", "vm_set_pu"):
+            ct.get_controller_index(net, parameters={key: value})
+
+
+def test_controller_type_index_cache(net):
+    # the lazy type->indices cache of net.controller must not serve stale entries after a
+    # controller is overwritten in place or the index of a dropped one is reused
+    class SpecialController(Controller):
+        pass
+
+    idx0 = DummyController(net).index
+    idx1 = DummyController(net).index
+    assert get_controller_index_by_type(net, DummyController) == [idx0, idx1]
+    assert get_controller_index_by_type(net, SpecialController) == []
+
+    # overwrite in place: the net.controller index does not change, so the snapshot check of
+    # the cache cannot catch this - the explicit invalidation on controller creation must
+    SpecialController(net, index=idx1, overwrite=True)
+    assert get_controller_index_by_type(net, DummyController) == [idx0]
+    assert get_controller_index_by_type(net, SpecialController) == [idx1]
+
+    # drop a controller and hand its freed index to a controller of a different type
+    net.controller.drop(idx1, inplace=True)
+    assert get_controller_index_by_type(net, SpecialController) == []
+    idx2 = DummyController(net).index
+    assert idx2 == idx1
+    assert get_controller_index_by_type(net, DummyController) == [idx0, idx2]
+    assert get_controller_index_by_type(net, SpecialController) == []
+
+
 if __name__ == '__main__':
     pytest.main(['-s', __file__])